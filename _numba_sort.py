@@ -0,0 +1,56 @@
+"""
+Optional Numba-accelerated radix argsort for integer sort keys.
+
+`sorter` imports this module lazily and falls back to `np.argsort` when
+Numba is not installed, so the dependency stays optional. The sorter lives
+in a flat module (there is no `offer_sorter` package), hence the top-level
+`_numba_sort` module name.
+
+The hand-written LSD radix sort avoids Numba's comparatively slow
+`np.sort` lowering: eight 8-bit counting passes over biased uint64 keys
+are bandwidth-bound rather than comparison-bound, and each pass is stable,
+so the resulting permutation matches `np.argsort(..., kind="stable")`.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def radix_argsort_i64(keys: np.ndarray) -> np.ndarray:
+    """
+    Stable ascending argsort of an int64 array via LSD radix sort.
+
+    Signed keys are biased with an XOR of the sign bit so their unsigned
+    byte-wise order matches signed numeric order. Returns the permutation
+    as an int64 index array.
+    """
+    n = keys.shape[0]
+
+    # Bias the sign bit: signed order == unsigned order afterwards.
+    current_keys = np.empty(n, dtype=np.uint64)
+    for i in range(n):
+        current_keys[i] = np.uint64(keys[i] ^ np.int64(-0x8000000000000000))
+
+    order = np.arange(n, dtype=np.int64)
+    next_keys = np.empty(n, dtype=np.uint64)
+    next_order = np.empty(n, dtype=np.int64)
+
+    for shift in range(0, 64, 8):
+        counts = np.zeros(257, dtype=np.int64)
+        for i in range(n):
+            byte = (current_keys[i] >> np.uint64(shift)) & np.uint64(0xFF)
+            counts[byte + np.uint64(1)] += 1
+        for byte in range(256):
+            counts[byte + 1] += counts[byte]
+        for i in range(n):
+            byte = (current_keys[i] >> np.uint64(shift)) & np.uint64(0xFF)
+            position = counts[byte]
+            counts[byte] += 1
+            next_keys[position] = current_keys[i]
+            next_order[position] = order[i]
+        current_keys, next_keys = next_keys, current_keys
+        order, next_order = next_order, order
+
+    return order
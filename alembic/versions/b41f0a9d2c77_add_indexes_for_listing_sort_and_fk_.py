@@ -0,0 +1,44 @@
+"""Add indexes for listing sort and foreign key columns
+
+Revision ID: b41f0a9d2c77
+Revises: 8c57b2c84100
+Create Date: 2026-08-28 10:14:02.118736
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41f0a9d2c77'
+down_revision: Union[str, Sequence[str], None] = '8c57b2c84100'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Foreign keys used by eager-loading IN batches
+    op.create_index('ix_listing_location_id', 'listing', ['location_id'])
+    op.create_index('ix_listing_building_id', 'listing', ['building_id'])
+    op.create_index('ix_listing_owner_id', 'listing', ['owner_id'])
+    op.create_index('ix_listing_features_id', 'listing', ['features_id'])
+    # Hot sort columns used by ORDER BY ... LIMIT n
+    op.create_index('ix_listing_price_total_zl', 'listing', ['price_total_zl'])
+    op.create_index('ix_listing_price_per_sqm_detailed', 'listing', ['price_per_sqm_detailed'])
+    op.create_index('ix_listing_date_posted', 'listing', ['date_posted'])
+    # Composite index for stable keyset ordering by price
+    op.create_index('ix_listing_price_id', 'listing', ['price_total_zl', 'listing_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_listing_price_id', table_name='listing')
+    op.drop_index('ix_listing_date_posted', table_name='listing')
+    op.drop_index('ix_listing_price_per_sqm_detailed', table_name='listing')
+    op.drop_index('ix_listing_price_total_zl', table_name='listing')
+    op.drop_index('ix_listing_features_id', table_name='listing')
+    op.drop_index('ix_listing_owner_id', table_name='listing')
+    op.drop_index('ix_listing_building_id', table_name='listing')
+    op.drop_index('ix_listing_location_id', table_name='listing')
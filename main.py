@@ -1,7 +1,7 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
-from models.database import engine
+from models.database import engine, warm_up_pool
 from routers import health, hello
 from routers import locations, offers
 
@@ -14,6 +14,8 @@ async def lifespan(app: FastAPI):
     
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+    # Pre-open the connection pool so the first requests don't pay connect latency
+    await warm_up_pool()
     yield
     # Shutdown: Close database connections
     await engine.dispose()
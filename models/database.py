@@ -1,3 +1,5 @@
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from .base import Base
 
@@ -5,12 +7,31 @@ from .base import Base
 SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./sql_app.db"
 
 # Async engine for SQLite
+# Pool sizing is explicit so sudden load doesn't exhaust the default pool,
+# and pre-ping drops stale connections before a request trips over them.
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
     echo=True,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
 )
 
+
+async def warm_up_pool() -> None:
+    """
+    Eagerly open `pool_size` connections so early requests do not pay
+    connect/auth latency after a cold start.
+
+    Connections are opened concurrently and released back into the pool.
+    """
+    connections = await asyncio.gather(
+        *(engine.connect() for _ in range(engine.pool.size()))
+    )
+    for connection in connections:
+        await connection.close()
+
 # Async session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -1,7 +1,7 @@
 from datetime import date
 from decimal import Decimal
 from typing import Optional
-from sqlalchemy import Numeric
+from sqlalchemy import Column, Index, Numeric
 from sqlmodel import SQLModel, Field, Relationship
 
 
@@ -74,17 +74,30 @@ class Listing(SQLModel, table=True):
     
     __tablename__ = "listing"
 
+    # Composite index keeps keyset pagination ordered by price stable:
+    # ORDER BY price_total_zl, listing_id can be served by one index scan.
+    __table_args__ = (
+        Index("ix_listing_price_id", "price_total_zl", "listing_id"),
+    )
+
     listing_id: Optional[int] = Field(default=None, primary_key=True)
-    location_id: int = Field(foreign_key="location.location_id")
-    building_id: int = Field(foreign_key="building.building_id")
-    owner_id: int = Field(foreign_key="owner.owner_id")
-    features_id: int = Field(foreign_key="features.features_id")
+    # Foreign keys are indexed so eager-loading IN batches hit index scans.
+    location_id: int = Field(foreign_key="location.location_id", index=True)
+    building_id: int = Field(foreign_key="building.building_id", index=True)
+    owner_id: int = Field(foreign_key="owner.owner_id", index=True)
+    features_id: int = Field(foreign_key="features.features_id", index=True)
     rooms: Optional[int] = Field(default=None)
     area: Optional[Decimal] = Field(default=None, sa_column=Numeric(6, 2))
-    price_total_zl: Optional[Decimal] = Field(default=None, sa_column=Numeric(12, 2))
+    # Hot sort columns carry single-column indexes so ORDER BY ... LIMIT n
+    # does not degrade to a full-table sort.
+    price_total_zl: Optional[Decimal] = Field(
+        default=None, sa_column=Column("price_total_zl", Numeric(12, 2), index=True)
+    )
     price_sqm_zl: Optional[Decimal] = Field(default=None, sa_column=Numeric(12, 2))
-    price_per_sqm_detailed: Optional[Decimal] = Field(default=None, sa_column=Numeric(12, 2))
-    date_posted: Optional[date] = Field(default=None)
+    price_per_sqm_detailed: Optional[Decimal] = Field(
+        default=None, sa_column=Column("price_per_sqm_detailed", Numeric(12, 2), index=True)
+    )
+    date_posted: Optional[date] = Field(default=None, index=True)
     photo_count: Optional[int] = Field(default=None)
     url: Optional[str] = Field(default=None)
     image_url: Optional[str] = Field(default=None)
@@ -7,8 +7,8 @@ simple and focused on behavior.
 """
 from __future__ import annotations
 
-from sorter import OfferSorter
+from sorter import Offer, OfferSorter, SortedView
 
-__all__ = ["OfferSorter"]
+__all__ = ["Offer", "OfferSorter", "SortedView"]
 
 
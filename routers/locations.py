@@ -1,65 +1,146 @@
-from typing import Annotated
+from typing import Annotated, Any
 
+import msgspec
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from models.database import get_db
 from models.models import Location
+from schemas.locations import (
+    LocationPage,
+    LocationPageStruct,
+    LocationResponse,
+    LocationStruct,
+)
 
 router = APIRouter(prefix="/locations")
 
 
+class MsgspecJSONResponse(JSONResponse):
+    """JSON response rendered by msgspec's C-level encoder.
+
+    Used for read-only payloads built as `msgspec.Struct` instances, which
+    skips Pydantic model construction on the outbound path entirely.
+    Subclassing `JSONResponse` (rather than bare `Response`) matters:
+    FastAPI only documents `response_model` as the 200 schema in OpenAPI
+    when the route's response class is a `JSONResponse`; only `render`
+    is overridden.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
+
+
+def _location_struct(location: Location) -> LocationStruct:
+    """Build the msgspec representation of a single location row."""
+    return LocationStruct(
+        location_id=location.location_id,
+        city=location.city,
+        locality=location.locality,
+        city_district=location.city_district,
+        street=location.street,
+        full_address=location.full_address,
+        latitude=float(location.latitude) if location.latitude is not None else None,
+        longitude=float(location.longitude) if location.longitude is not None else None,
+    )
+
+# Base statement built once at import time; per-request variants are derived
+# from it (Select is immutable, so chaining returns new objects) instead of
+# reconstructing the whole ORM statement on every call.
+_LIST_LOCATIONS_STMT = select(Location).order_by(Location.location_id)
+
+
 @router.get(
     "/",
-    response_model=list[Location],
+    response_model=LocationPage,
+    response_class=MsgspecJSONResponse,
     summary="List locations",
-    description="Returns a paginated list of locations.",
+    description="Returns a keyset-paginated list of locations.",
 )
 async def list_locations(
     db: Annotated[AsyncSession, Depends(get_db)],
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    after_id: int | None = Query(
+        None,
+        description="Cursor: return locations with location_id greater than this value",
+    ),
+    skip: int = Query(
+        0,
+        ge=0,
+        deprecated=True,
+        description="Number of records to skip (deprecated, use after_id instead)",
+    ),
     limit: int = Query(100, ge=1, description="Maximum number of records to return"),
-) -> list[Location]:
+) -> MsgspecJSONResponse:
     """
-    Endpoint returning a paginated list of locations.
+    Endpoint returning a keyset-paginated list of locations.
+
+    Pagination uses an `after_id` cursor: the query is a bounded index range
+    scan (`location_id > after_id ORDER BY location_id LIMIT limit`), so the
+    cost does not grow with page depth the way OFFSET does. The legacy `skip`
+    parameter is still accepted for backward compatibility but is deprecated.
 
-    Default pagination: skip=0, limit=100.
+    The response intentionally exposes `has_more` instead of a total count:
+    fetching `limit + 1` rows and dropping the extra one avoids the hidden
+    `SELECT COUNT(*)` an offset-based pagination layer would run per request.
+
+    Default page size: limit=100.
     """
-    stmt = (
-        select(Location)
-        .order_by(Location.location_id)
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(stmt)
-    locations: list[Location] = list(result.scalars().all())
+    # Fetch one row beyond the page to learn whether more data exists.
+    stmt = _LIST_LOCATIONS_STMT.limit(limit + 1)
+    if after_id is not None:
+        stmt = stmt.where(Location.location_id > after_id)
+    elif skip:
+        # Deprecated OFFSET path, kept only for old clients.
+        stmt = stmt.offset(skip)
 
-    return locations
+    # Stream rows in chunks instead of buffering the whole page at once,
+    # so peak memory stays O(chunk) even when `limit` is raised.
+    result = await db.stream_scalars(stmt.execution_options(yield_per=100))
+    locations: list[Location] = [location async for location in result]
+
+    has_more = len(locations) > limit
+    if has_more:
+        locations = locations[:limit]
+
+    next_cursor = locations[-1].location_id if has_more else None
+
+    # The rows come straight from the database and are already coerced, so
+    # the page is built as msgspec structs and encoded in C, bypassing both
+    # Pydantic model construction and per-row validation for trusted data.
+    # The LocationPage response_model above still documents the schema.
+    page = LocationPageStruct(
+        items=[_location_struct(location) for location in locations],
+        next_cursor=next_cursor,
+        has_more=has_more,
+    )
+    return MsgspecJSONResponse(page)
 
 
 @router.get(
     "/{location_id}",
-    response_model=Location,
+    response_model=LocationResponse,
+    response_class=MsgspecJSONResponse,
     summary="Get location details",
     description="Returns full details of a specific location by its ID",
 )
 async def get_location_details(
     location_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> Location:
+) -> MsgspecJSONResponse:
     """
     Endpoint returning full details of a single location.
 
     Raises 404 if location does not exist.
     """
-    stmt = select(Location).where(Location.location_id == location_id)
-    result = await db.execute(stmt)
-    location: Location | None = result.scalar_one_or_none()
+    # Primary-key lookup: session.get() short-circuits to the identity map
+    # and reuses a cached compiled statement instead of building a new select.
+    location: Location | None = await db.get(Location, location_id)
 
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
 
-    return location
+    return MsgspecJSONResponse(_location_struct(location))
 
 
@@ -1,16 +1,36 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
 from models.database import get_db
 from models.models import Listing
+from schemas.offers import OfferListItem
+from sorter import OfferSorter
 
 
 router = APIRouter()
 
+# Columns exposed by the list view; large text fields (url, image_url,
+# description_text) are only fetched by the detail endpoint.
+OFFER_LIST_COLUMNS = (
+    "listing_id",
+    "location_id",
+    "rooms",
+    "area",
+    "price_total_zl",
+    "price_per_sqm_detailed",
+    "date_posted",
+)
+
+# Base statement built once at import time. Selecting only the summary
+# columns keeps both the SQL result and the serialized payload small; the
+# previous entity select dragged every Listing column (including long text)
+# through the ORM for each row.
+_LIST_OFFERS_STMT = select(*(getattr(Listing, column) for column in OFFER_LIST_COLUMNS))
+
 
 def apply_ordering(
     stmt: Select,
@@ -20,60 +40,70 @@ def apply_ordering(
     """
     Apply dynamic ORDER BY clause based on allowed sort fields.
 
-    Currently supported:
-    - sort_by=price (mapped to Listing.price_total_zl)
+    Delegates to `OfferSorter.apply_sql_order` so the field whitelist lives
+    in a single place shared with the in-memory sorter (`SortField`):
+    - sort_by=price|price_per_sqm|date_added|area
     - order=asc|desc (default: desc)
     """
-    if not sort_by:
-        return stmt
-
-    # Whitelist of sortable fields
-    sortable_fields: dict[str, object] = {
-        "price": Listing.price_total_zl,
-    }
-
-    sort_column = sortable_fields.get(sort_by)
-    if sort_column is None:
-        # Unsupported sort field -> return statement unchanged
-        return stmt
-
-    sort_order = (order or "desc").lower()
-    if sort_order == "asc":
-        return stmt.order_by(sort_column.asc())
-
-    # Default to descending order
-    return stmt.order_by(sort_column.desc())
+    sort_order = "asc" if (order or "desc").lower() == "asc" else "desc"
+    return OfferSorter.apply_sql_order(stmt, sort_by=sort_by, direction=sort_order)
 
 
 @router.get(
     "/offers",
-    response_model=list[Listing],
+    response_model=list[OfferListItem],
     summary="List offers",
-    description="Returns a list of offers with optional sorting.",
+    description="Returns a list of offer summaries with optional sorting.",
 )
 async def list_offers(
     db: Annotated[AsyncSession, Depends(get_db)],
     sort_by: str | None = Query(
         default=None,
-        description="Sort field (currently supported: 'price').",
+        description="Sort field: 'price', 'price_per_sqm', 'date_added' or 'area'.",
     ),
     order: str | None = Query(
         default=None,
         description="Sort order: 'asc' or 'desc' (default: 'desc').",
     ),
-) -> list[Listing]:
+) -> list[dict]:
     """
-    Endpoint returning a list of offers (listings) with optional sorting.
+    Endpoint returning a list of offer summaries with optional sorting.
+
+    Only the summary columns from `OFFER_LIST_COLUMNS` are fetched and
+    serialized; the full record is served by GET /offers/{listing_id}.
 
     Sorting is controlled by:
     - sort_by: logical field name (e.g. 'price')
     - order: 'asc' or 'desc' (default: 'desc')
     """
-    stmt = select(Listing)
-    stmt = apply_ordering(stmt, sort_by=sort_by, order=order)
+    stmt = apply_ordering(_LIST_OFFERS_STMT, sort_by=sort_by, order=order)
+
+    # Stream rows in chunks instead of materializing the full result set in
+    # one buffer; the response_model validates each mapping into an
+    # OfferListItem.
+    result = await db.stream(stmt.execution_options(yield_per=200))
+    return [dict(row) async for row in result.mappings()]
+
+
+@router.get(
+    "/offers/{listing_id}",
+    response_model=Listing,
+    summary="Get offer details",
+    description="Returns full details of a specific offer by its ID",
+)
+async def get_offer_details(
+    listing_id: int,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Listing:
+    """
+    Endpoint returning full details of a single offer (listing).
+
+    Raises 404 if offer does not exist.
+    """
+    offer: Listing | None = await db.get(Listing, listing_id)
 
-    result = await db.execute(stmt)
-    offers: list[Listing] = list(result.scalars().all())
+    if not offer:
+        raise HTTPException(status_code=404, detail="Offer not found")
 
-    return offers
+    return offer
 
@@ -0,0 +1,81 @@
+from typing import Optional
+
+import msgspec
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class LocationResponse(BaseModel):
+    """Odpowiedź z danymi pojedynczej lokalizacji."""
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "location_id": 1,
+                "city": "Warszawa",
+                "locality": "Śródmieście",
+                "city_district": "Śródmieście Północne",
+                "street": "Marszałkowska",
+                "full_address": "Marszałkowska 1, 00-001 Warszawa",
+                "latitude": 52.2297,
+                "longitude": 21.0122,
+            }
+        },
+    )
+
+    location_id: int = Field(..., description="Identyfikator lokalizacji")
+    city: Optional[str] = Field(None, description="Miasto")
+    locality: Optional[str] = Field(None, description="Miejscowość")
+    city_district: Optional[str] = Field(None, description="Dzielnica")
+    street: Optional[str] = Field(None, description="Ulica")
+    full_address: Optional[str] = Field(None, description="Pełny adres")
+    latitude: Optional[float] = Field(None, description="Szerokość geograficzna")
+    longitude: Optional[float] = Field(None, description="Długość geograficzna")
+
+
+class LocationPage(BaseModel):
+    """Odpowiedź stronicowana z endpointu listy lokalizacji."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [LocationResponse.model_config["json_schema_extra"]["example"]],
+                "next_cursor": 1,
+                "has_more": True,
+            }
+        }
+    )
+
+    items: list[LocationResponse] = Field(..., description="Lokalizacje na bieżącej stronie")
+    next_cursor: Optional[int] = Field(
+        None,
+        description="Kursor do pobrania kolejnej strony (location_id ostatniego rekordu)",
+    )
+    has_more: bool = Field(
+        False,
+        description="Czy istnieją kolejne rekordy po bieżącej stronie",
+    )
+
+
+class LocationStruct(msgspec.Struct):
+    """Odpowiednik `LocationResponse` serializowany przez msgspec.
+
+    Struktury msgspec omijają konstrukcję modeli Pydantic i są kodowane
+    w całości w C; modele Pydantic powyżej pozostają źródłem schematu
+    OpenAPI dla endpointów.
+    """
+
+    location_id: int
+    city: Optional[str] = None
+    locality: Optional[str] = None
+    city_district: Optional[str] = None
+    street: Optional[str] = None
+    full_address: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+
+class LocationPageStruct(msgspec.Struct):
+    """Odpowiednik `LocationPage` serializowany przez msgspec."""
+
+    items: list[LocationStruct]
+    next_cursor: Optional[int] = None
+    has_more: bool = False
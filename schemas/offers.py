@@ -0,0 +1,34 @@
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class OfferListItem(BaseModel):
+    """Skrócona odpowiedź z pojedynczym ogłoszeniem w widoku listy.
+
+    Zawiera tylko kolumny podsumowania – duże pola tekstowe (opis, adresy
+    URL) są dostępne wyłącznie w widoku szczegółów ogłoszenia.
+    """
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "listing_id": 1,
+                "location_id": 1,
+                "rooms": 3,
+                "area": "50.00",
+                "price_total_zl": "500000.00",
+                "price_per_sqm_detailed": "10000.00",
+                "date_posted": "2024-01-10",
+            }
+        }
+    )
+
+    listing_id: int = Field(..., description="Identyfikator ogłoszenia")
+    location_id: int = Field(..., description="Identyfikator lokalizacji")
+    rooms: Optional[int] = Field(None, description="Liczba pokoi")
+    area: Optional[Decimal] = Field(None, description="Metraż w m²")
+    price_total_zl: Optional[Decimal] = Field(None, description="Cena całkowita w zł")
+    price_per_sqm_detailed: Optional[Decimal] = Field(None, description="Cena za m² w zł")
+    date_posted: Optional[date] = Field(None, description="Data dodania ogłoszenia")
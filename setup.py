@@ -0,0 +1,21 @@
+"""Opcjonalna budowa akceleratora C `_offer_sorter`.
+
+Metadane projektu pozostają w `pyproject.toml`; ten plik istnieje tylko
+po to, by zbudować rozszerzenie Cython, gdy Cython jest dostępny.
+Bez Cythona instalacja przebiega normalnie, a `sorter` korzysta ze
+ścieżek czysto pythonowych.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(["_offer_sorter.pyx"], language_level="3")
+
+# py_modules=[] wyłącza autodetekcję pakietów setuptools, która w płaskim
+# układzie repozytorium błędnie traktuje moduły najwyższego poziomu jako
+# osobne pakiety.
+setup(ext_modules=ext_modules, py_modules=[])
+
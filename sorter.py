@@ -15,13 +15,118 @@ to keep it easy to reuse with different data sources and models.
 """
 from __future__ import annotations
 
+import sys
+import types
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
 from decimal import Decimal
 from enum import Enum
-from typing import Literal, Mapping, Any, Sequence
+from functools import lru_cache
+from operator import itemgetter
+from typing import ClassVar
+from typing import Callable, Literal, Mapping, Any, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy.sql import Select
 
 
 SortDirection = Literal["asc", "desc"]
 
+# Above this size, sorting in Python instead of the database is almost
+# certainly a mistake - warn so callers switch to `apply_sql_order`.
+_IN_MEMORY_WARN_THRESHOLD = 1000
+
+# At or below this size a plain insertion sort over precomputed keys does
+# less total work than Timsort's setup (minrun detection, run stack).
+_INSERTION_SORT_MAX = 32
+
+# Clamp for the measured NumPy crossover: a noisy calibration run must not
+# route tiny lists through array conversion nor disable NumPy entirely.
+_NUMPY_CROSSOVER_MIN = 64
+_NUMPY_CROSSOVER_MAX = 4096
+
+
+def _calibrate_numpy_crossover() -> float:
+    """
+    Measure the size where the NumPy argsort path starts to pay off.
+
+    Sorting is memory-bound at small n (per-record setup dominates) and
+    compare-bound at large n, so the crossover point depends on the host.
+    A sub-millisecond probe at n=256 times `sorted` against a stable
+    `np.argsort` and scales the ratio linearly, which is coarse but only
+    needs to land in the right order of magnitude - the result is clamped
+    either way. Without NumPy the sentinel inf disables the path.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return float("inf")
+
+    import random
+    import time
+
+    n = 256
+    values = [float(i) for i in range(n)]
+    random.Random(0).shuffle(values)
+    column = np.array(values)
+
+    # Warm up allocator and ufunc caches so the timed runs are comparable.
+    sorted(values)
+    np.argsort(column, kind="stable")
+
+    reps = 20
+    start = time.perf_counter()
+    for _ in range(reps):
+        sorted(values)
+    t_python = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(reps):
+        np.argsort(np.array(values), kind="stable")
+    t_numpy = time.perf_counter() - start
+
+    if t_python <= 0.0:
+        return float(_NUMPY_CROSSOVER_MIN)
+
+    crossover = n * (t_numpy / t_python)
+    return float(min(max(crossover, _NUMPY_CROSSOVER_MIN), _NUMPY_CROSSOVER_MAX))
+
+
+# Above this size the NumPy argsort fast path beats `sorted` with a Python
+# key function; below it the array-conversion setup costs more than it
+# saves. Measured once at import; inf when NumPy is unavailable.
+_NUMPY_CROSSOVER = _calibrate_numpy_crossover()
+
+
+def _supports_keylist() -> bool:
+    """
+    Probe whether this CPython build accepts `sorted(..., keylist=...)`.
+
+    The proposed `keylist` argument (CPython gh-142105) sorts against a
+    pre-extracted key list without any per-element callback. Probing once at
+    import keeps `sort_offers` ready to take that path on interpreters that
+    ship it, while current builds fall back to the `key=` callable.
+    """
+    try:
+        sorted((), keylist=())
+    except TypeError:
+        return False
+    return True
+
+
+_HAS_KEYLIST = _supports_keylist()
+
+# Small LRU of recently computed sort permutations, keyed by the identity of
+# the offer sequence plus the sort parameters. Entries hold a strong
+# reference to the sequence so its id() cannot be recycled while cached.
+# This turns the common UI pattern of toggling sort direction over the same
+# list into an O(n) copy instead of a fresh O(n log n) sort; it assumes the
+# cached sequence is not mutated in place between calls.
+_RESULT_CACHE: OrderedDict[tuple, tuple[Sequence, list]] = OrderedDict()
+_RESULT_CACHE_MAX = 8
+
 
 class SortField(str, Enum):
     """Supported sort fields for offers."""
@@ -32,6 +137,106 @@ class SortField(str, Enum):
     AREA = "area"
 
 
+@dataclass(slots=True, frozen=True)
+class Offer:
+    """
+    Compact offer record.
+
+    A slotted, frozen dataclass is several times smaller than the
+    equivalent dict and attribute access is a fixed slot offset instead of
+    a hash probe. Mapping-style access (`offer["price"]`, `.get`, `in`) is
+    provided so the sorter's key functions and existing dict-based callers
+    work with both representations.
+    """
+
+    id: int
+    price: int
+    area: int
+    date_added: date
+    # Proleptic-Gregorian ordinal of `date_added`, precomputed so date
+    # sorts compare plain ints instead of calling `date.__lt__`.
+    date_added_ord: int = field(init=False)
+
+    # Readable keys, including the derived ones; used by the mapping shim so
+    # `in`/`get` do not accidentally expose methods as keys.
+    _fields: ClassVar[frozenset[str]] = frozenset(
+        ("id", "price", "area", "date_added", "date_added_ord", "price_per_sqm")
+    )
+
+    def __post_init__(self) -> None:
+        """Derive the date ordinal once at construction time."""
+        # `object.__setattr__` bypasses the frozen-dataclass guard.
+        object.__setattr__(self, "date_added_ord", self.date_added.toordinal())
+
+    @property
+    def price_per_sqm(self) -> float:
+        """Derived price per square meter; not stored to avoid drift."""
+        return self.price / self.area
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Mapping-compatible lookup with a default for unknown keys."""
+        if key not in self._fields:
+            return default
+        return getattr(self, key)
+
+
+class SortedView:
+    """
+    Lazy, read-only view of offers in a sorted order.
+
+    Holds the original sequence plus the argsort permutation and indexes
+    through it on access, so callers that only touch the first page (or a
+    single element) never pay for materializing the full reordered list.
+    Iteration and `list()` still yield every element in sorted order, which
+    keeps the view drop-in for callers that consume the whole result.
+    """
+
+    __slots__ = ("_base", "_order")
+
+    def __init__(self, base: Sequence[Mapping[str, Any]], order: Sequence[int]) -> None:
+        self._base = base
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # Slicing the permutation is cheap; the elements themselves
+            # stay lazy in the returned sub-view.
+            return SortedView(self._base, self._order[index])
+        return self._base[self._order[index]]
+
+    def __iter__(self):
+        base = self._base
+        return (base[i] for i in self._order)
+
+    def to_list(self) -> list[Mapping[str, Any]]:
+        """
+        Materialize the view as a plain list.
+
+        Preallocates the result with `[None] * n` and fills it by index
+        with a locally bound `__getitem__`, instead of `list(self)` - a
+        generator gives `list()` no length hint, so that route grows the
+        result through append's amortized doubling.
+        """
+        order = self._order
+        n = len(order)
+        out: list = [None] * n
+        get = self._base.__getitem__
+        for k in range(n):
+            out[k] = get(order[k])
+        return out
+
+
 class OfferSorter:
     """Utility class responsible for sorting offer collections."""
 
@@ -40,56 +245,181 @@ class OfferSorter:
         offers: Sequence[Mapping[str, Any]],
         sort_by: str | None = None,
         direction: SortDirection = "asc",
-    ) -> list[Mapping[str, Any]]:
+        precise: bool = False,
+    ) -> Sequence[Mapping[str, Any]]:
         """
         Sort a collection of offers by a given criterion.
 
-        The function does not mutate the original list and always returns
-        a new list instance.
+        The function does not mutate the original list. Argsort-backed
+        paths return a lazy `SortedView` over the permutation, so callers
+        that only read a page never materialize the full reordered list;
+        other paths return a new list. Both iterate in sorted order.
 
         If `sort_by` is None or unsupported, the offers are returned unchanged.
-        """
-        if not offers:
-            return []
 
-        # Default behavior for "Najtrafniejsze" – for now, return list unchanged.
+        By default price-like keys are compared as floats, which is accurate
+        for ordering purposes and avoids Decimal arithmetic per comparison.
+        Pass `precise=True` to compare with exact Decimal semantics instead.
+        """
+        # Default behavior for "Najtrafniejsze" – for now, return list
+        # unchanged. `list()` on a list is a single allocation plus a
+        # memcpy of the element pointers, so this also covers the empty
+        # case without a dedicated branch.
         if not sort_by:
             return list(offers)
 
-        try:
-            sort_field = SortField(sort_by)
-        except ValueError:
+        if len(offers) > _IN_MEMORY_WARN_THRESHOLD:
+            warnings.warn(
+                f"Sorting {len(offers)} offers in memory; "
+                "push the ORDER BY into SQL via OfferSorter.apply_sql_order instead.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+        # O(1) membership lookup; avoids the raise/catch cost of
+        # SortField(sort_by) on every call that carries an invalid field.
+        # Interning first lets the dict probe succeed on the identity
+        # check instead of a character compare - request-supplied strings
+        # are built at runtime and would otherwise never be identical to
+        # the enum's (compile-time interned) values.
+        sort_field = SortField._value2member_map_.get(sys.intern(sort_by))
+        if sort_field is None:
             # Unknown sort field – do not attempt to sort.
             return list(offers)
 
         reverse = direction == "desc"
 
-        return sorted(
-            offers,
-            key=lambda offer: OfferSorter._build_sort_key(offer, sort_field),
-            reverse=reverse,
-        )
+        # Serve repeated sorts of the same sequence (e.g. direction toggles
+        # in a UI) from the permutation cache as an O(n) copy.
+        cache_key = (id(offers), sort_field, reverse, precise)
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None and cached[0] is offers:
+            _RESULT_CACHE.move_to_end(cache_key)
+            return list(cached[1])
+
+        result: Sequence[Mapping[str, Any]] | None = None
+
+        # Large sorts go through NumPy when available: the compare loop runs
+        # vectorized in C over a columnar array instead of calling back into
+        # Python per element.
+        if len(offers) >= _NUMPY_CROSSOVER and not precise:
+            result = _numpy_sorted(offers, sort_field, reverse)
+
+        # Without NumPy, integer-keyed sorts can still run their compare
+        # loop in C through the optional Cython accelerator.
+        if result is None and not precise and sort_field is SortField.DATE_ADDED:
+            c_sort = _c_int_sort_fn()
+            if c_sort is not None:
+                try:
+                    result = c_sort(list(offers), "date_added_ord", reverse)
+                except (KeyError, TypeError, OverflowError):
+                    # Records without the precomputed ordinal (plain dicts)
+                    # fall through to the Python paths.
+                    result = None
+
+        if result is None and len(offers) <= _INSERTION_SORT_MAX:
+            key_fn = (_PRECISE_KEY_FUNCS if precise else _KEY_FUNCS)[sort_field]
+            result = _insertion_sorted(offers, key_fn, reverse)
+
+        if result is None:
+            if _HAS_KEYLIST:
+                # Argsort against a pre-extracted key list: no Python
+                # callback runs inside the sort itself.
+                key_fn = (_PRECISE_KEY_FUNCS if precise else _KEY_FUNCS)[sort_field]
+                keys = [key_fn(offer) for offer in offers]
+                order = sorted(range(len(offers)), keylist=keys, reverse=reverse)
+                result = SortedView(offers, order)
+            else:
+                # One dict hit resolves a closure with the key function and
+                # direction already bound - no per-call branching remains.
+                sort_fn = (_PRECISE_DISPATCH if precise else _DISPATCH)[(sort_field, reverse)]
+                result = sort_fn(offers)
+
+        snapshot = result.to_list() if isinstance(result, SortedView) else list(result)
+        _RESULT_CACHE[cache_key] = (offers, snapshot)
+        if len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+            _RESULT_CACHE.popitem(last=False)
+
+        return result
 
     @staticmethod
-    def _build_sort_key(
-        offer: Mapping[str, Any],
-        sort_field: SortField,
-    ) -> Any:
-        """Compute a comparable key used for sorting a single offer."""
-        if sort_field is SortField.PRICE:
-            return OfferSorter._normalize_price_value(offer.get("price"))
+    def sort_offers_many(
+        offers: Sequence[Mapping[str, Any]],
+        specs: Sequence[tuple[str, SortDirection]],
+    ) -> dict[tuple[str, SortDirection], list[Mapping[str, Any]]]:
+        """
+        Compute several sort orders of the same offers in one pass.
 
-        if sort_field is SortField.PRICE_PER_SQM:
-            return OfferSorter._calculate_price_per_sqm(offer)
+        For UI code that precomputes every tab's ordering, this amortizes
+        the expensive part - extracting each sort field into a columnar
+        array - across all requested directions: each field's column is
+        materialized once and argsorted per spec. Specs with an unknown
+        field map to an unchanged copy, mirroring `sort_offers`.
+        """
+        results: dict[tuple[str, SortDirection], list[Mapping[str, Any]]] = {}
+        if not specs:
+            return results
 
-        if sort_field is SortField.DATE_ADDED:
-            return offer.get("date_added")
+        try:
+            import numpy as np  # noqa: F401 - availability probe
+        except ImportError:
+            np = None
+
+        columns: dict[SortField, Any] = {}
+        for field_value, direction in specs:
+            spec = (field_value, direction)
+            if spec in results:
+                continue
+
+            sort_field = SortField._value2member_map_.get(field_value)
+            if sort_field is None:
+                results[spec] = list(offers)
+                continue
+            reverse = direction == "desc"
+
+            if np is not None and offers:
+                if sort_field not in columns:
+                    try:
+                        columns[sort_field] = _numpy_column(offers, sort_field)
+                    except (KeyError, TypeError, ValueError):
+                        columns[sort_field] = None
+                column = columns[sort_field]
+                if column is not None:
+                    order = _argsort_column(column, reverse)
+                    results[spec] = _gather(offers, order)
+                    continue
+
+            results[spec] = _DISPATCH[(sort_field, reverse)](offers)
+
+        return results
 
-        if sort_field is SortField.AREA:
-            return offer.get("area")
+    @staticmethod
+    def apply_sql_order(
+        stmt: Select,
+        sort_by: str | None,
+        direction: SortDirection = "asc",
+    ) -> Select:
+        """
+        Apply an ORDER BY clause for a supported sort field to a statement.
 
-        # Fallback – should not happen with a closed enum, but keeps behavior safe.
-        return 0
+        This is the SQL counterpart of `sort_offers`: instead of fetching all
+        rows and sorting in Python, the ordering is pushed into the database
+        so it can use an index and return only the page that is needed.
+
+        If `sort_by` is None or unsupported, the statement is returned
+        unchanged (mirroring the in-memory behavior).
+        """
+        if not sort_by:
+            return stmt
+
+        sort_field = SortField._value2member_map_.get(sys.intern(sort_by))
+        if sort_field is None:
+            return stmt
+
+        clause = _sql_order_clauses().get(
+            (sort_field, "desc" if direction == "desc" else "asc")
+        )
+        return stmt.order_by(clause) if clause is not None else stmt
 
     @staticmethod
     def _normalize_price_value(value: Any) -> Decimal:
@@ -138,4 +468,303 @@ class OfferSorter:
         return price_dec / area_dec
 
 
-__all__ = ["OfferSorter"]
+@lru_cache(maxsize=1)
+def _sql_order_clauses() -> dict[tuple[SortField, str], Any]:
+    """
+    Build the (sort field, direction) -> ORDER BY clause mapping once.
+
+    The clauses are constructed a single time and reused across requests, so
+    per-call work in `apply_sql_order` is reduced to one dict lookup and the
+    statement construction hits SQLAlchemy's compiled-statement cache
+    consistently. Models are imported lazily so the in-memory sorting path
+    stays usable without pulling in the ORM (mirrors the lazy import in
+    `models`).
+    """
+    from models.models import Listing
+
+    columns = {
+        SortField.PRICE: Listing.price_total_zl,
+        SortField.PRICE_PER_SQM: Listing.price_per_sqm_detailed,
+        SortField.DATE_ADDED: Listing.date_posted,
+        SortField.AREA: Listing.area,
+    }
+
+    clauses: dict[tuple[SortField, str], Any] = {}
+    for sort_field, column in columns.items():
+        clauses[(sort_field, "asc")] = column.asc()
+        clauses[(sort_field, "desc")] = column.desc()
+    return clauses
+
+
+def _numpy_column(offers: Sequence[Mapping[str, Any]], sort_field: SortField) -> Any:
+    """
+    Materialize one sort field as a NumPy column (structure-of-arrays).
+
+    Numeric fields become a float64 array via the regular key functions;
+    dates become an int64 array of their precomputed ordinals so they sort
+    as plain 64-bit integers. Extracting the column once means the sort
+    loop touches a contiguous array instead of chasing one record per
+    comparison.
+    """
+    import numpy as np
+
+    if sort_field is SortField.DATE_ADDED:
+        return np.fromiter(
+            (_int_key_date_added(offer) for offer in offers),
+            dtype=np.int64,
+            count=len(offers),
+        )
+
+    key_fn = _KEY_FUNCS[sort_field]
+    return np.nan_to_num(
+        np.fromiter((key_fn(offer) for offer in offers), dtype=np.float64, count=len(offers))
+    )
+
+
+def _numpy_sorted(
+    offers: Sequence[Mapping[str, Any]],
+    sort_field: SortField,
+    reverse: bool,
+) -> SortedView | None:
+    """
+    Sort a large offer collection through NumPy's argsort.
+
+    The sort field is extracted once into a columnar array and the
+    permutation is computed with a stable C-level sort; descending order
+    negates the (integer-viewed) keys so ties keep their original relative
+    order, matching `sorted`'s stability. The permutation is returned as
+    a lazy `SortedView` rather than a materialized list. Returns None
+    when NumPy is unavailable or the column cannot be materialized, in
+    which case the caller falls back to `sorted`.
+    """
+    try:
+        import numpy as np  # noqa: F401 - availability probe
+    except ImportError:
+        return None
+
+    try:
+        column = _numpy_column(offers, sort_field)
+    except (KeyError, TypeError, ValueError):
+        # Missing or non-uniform keys – let the Python path handle them.
+        return None
+
+    order = _argsort_column(column, reverse)
+    return SortedView(offers, order)
+
+
+def _gather(
+    offers: Sequence[Mapping[str, Any]], order: Sequence[int]
+) -> list[Mapping[str, Any]]:
+    """
+    Materialize `[offers[i] for i in order]` without a Python-level loop.
+
+    `itemgetter(*order)` performs the whole gather in one C call instead
+    of one bytecode iteration per element. The short-length guards exist
+    because a single-index itemgetter returns a bare element rather than
+    a tuple.
+    """
+    n = len(order)
+    if n == 0:
+        return []
+    if n == 1:
+        return [offers[order[0]]]
+    return list(itemgetter(*order)(offers))
+
+
+def _insertion_sorted(
+    offers: Sequence[Mapping[str, Any]],
+    key_fn: Callable[[Mapping[str, Any]], Any],
+    reverse: bool,
+) -> list[Mapping[str, Any]]:
+    """
+    Stable insertion sort over precomputed keys, for tiny inputs.
+
+    Below a few dozen elements Timsort's per-call setup dwarfs the actual
+    comparisons; a straight insertion loop over a pre-extracted key list
+    does less total work there. Keys are extracted once (decorate-sort-
+    undecorate), and the shift condition is strict in both directions so
+    ties keep their original order, matching `sorted`'s stability.
+    """
+    keys = [key_fn(offer) for offer in offers]
+    result = list(offers)
+    if reverse:
+        for i in range(1, len(result)):
+            key = keys[i]
+            item = result[i]
+            j = i
+            while j > 0 and keys[j - 1] < key:
+                keys[j] = keys[j - 1]
+                result[j] = result[j - 1]
+                j -= 1
+            keys[j] = key
+            result[j] = item
+    else:
+        for i in range(1, len(result)):
+            key = keys[i]
+            item = result[i]
+            j = i
+            while j > 0 and key < keys[j - 1]:
+                keys[j] = keys[j - 1]
+                result[j] = result[j - 1]
+                j -= 1
+            keys[j] = key
+            result[j] = item
+    return result
+
+
+def _argsort_column(column: Any, reverse: bool) -> Any:
+    """
+    Stable argsort of a key column, honoring descending order.
+
+    Descending order negates the keys instead of reversing the ascending
+    permutation, so ties keep their original relative order and the result
+    matches `sorted`'s stability. Integer columns route through the
+    optional Numba radix argsort when it is available.
+    """
+    import numpy as np
+
+    if reverse:
+        column = -column
+
+    if column.dtype == np.int64:
+        radix_argsort = _radix_argsort_fn()
+        if radix_argsort is not None:
+            return radix_argsort(column)
+
+    return np.argsort(column, kind="stable")
+
+
+@lru_cache(maxsize=1)
+def _c_int_sort_fn() -> Callable[[list, str, bool], list] | None:
+    """
+    Resolve the optional Cython integer-key sort once.
+
+    The `_offer_sorter` extension (see `_offer_sorter.pyx` and `setup.py`)
+    is only present when it was built with Cython available; returns None
+    otherwise, keeping the accelerator strictly optional.
+    """
+    try:
+        from _offer_sorter import sort_by_int_key
+    except ImportError:
+        return None
+    return sort_by_int_key
+
+
+@lru_cache(maxsize=1)
+def _radix_argsort_fn() -> Callable[[Any], Any] | None:
+    """
+    Resolve the optional Numba radix argsort once.
+
+    Returns None when Numba is not installed, keeping the JIT dependency
+    optional; integer columns then fall back to `np.argsort`.
+    """
+    try:
+        from _numba_sort import radix_argsort_i64
+    except ImportError:
+        return None
+    return radix_argsort_i64
+
+
+def _int_key_date_added(offer: Mapping[str, Any]) -> int:
+    """
+    Date added as an integer ordinal sort key.
+
+    Prefers a precomputed `date_added_ord` (always present on `Offer`
+    records), otherwise converts `date_added` on the fly. Comparing ints
+    is several times cheaper than `date.__lt__` and keeps the key column
+    radix-sortable. Missing dates sort first (as zero).
+    """
+    ord_value = offer.get("date_added_ord")
+    if ord_value is not None:
+        return ord_value
+
+    value = offer.get("date_added")
+    return 0 if value is None else value.toordinal()
+
+
+def _float_key_price(offer: Mapping[str, Any]) -> float:
+    """Price as a float sort key; missing values sort first (as zero)."""
+    value = offer.get("price")
+    return 0.0 if value is None else float(value)
+
+
+def _float_key_price_per_sqm(offer: Mapping[str, Any]) -> float:
+    """
+    Price per square meter as a float sort key.
+
+    Prefers a precomputed `price_per_sqm`, otherwise derives it from
+    `price` and `area`. Offers with a zero area sort last.
+    """
+    direct_value = offer.get("price_per_sqm")
+    if direct_value is not None:
+        return float(direct_value)
+
+    total_price = offer.get("price")
+    area = offer.get("area")
+
+    if total_price is None or area is None:
+        return 0.0
+
+    area_float = float(area)
+    if area_float == 0.0:
+        return float("inf")
+
+    return float(total_price) / area_float
+
+
+# Key function per sort field, resolved once per `sort_offers` call. A dict
+# lookup replaces the previous per-element if/elif chain over enum members,
+# so `sorted` invokes the specialized function directly for every comparison.
+# Float keys compare at C level; the Decimal variants below are kept for
+# callers that opt into exact comparisons via `precise=True`.
+#
+# The area key is a plain lookup, so it uses a C-implemented `itemgetter`
+# callable; the wrapping lambda only exists to keep offers without the key
+# sortable (they sort first) instead of raising KeyError.
+_KEY_FUNCS: dict[SortField, Callable[[Mapping[str, Any]], Any]] = {
+    SortField.PRICE: _float_key_price,
+    SortField.PRICE_PER_SQM: _float_key_price_per_sqm,
+    SortField.DATE_ADDED: _int_key_date_added,
+    SortField.AREA: lambda offer, _get=itemgetter("area"): (
+        _get(offer) if "area" in offer else 0.0
+    ),
+}
+
+_PRECISE_KEY_FUNCS: dict[SortField, Callable[[Mapping[str, Any]], Any]] = {
+    SortField.PRICE: lambda offer: OfferSorter._normalize_price_value(offer.get("price")),
+    SortField.PRICE_PER_SQM: OfferSorter._calculate_price_per_sqm,
+    SortField.DATE_ADDED: _KEY_FUNCS[SortField.DATE_ADDED],
+    SortField.AREA: _KEY_FUNCS[SortField.AREA],
+}
+
+
+def _build_dispatch(
+    key_funcs: Mapping[SortField, Callable[[Mapping[str, Any]], Any]],
+) -> dict[tuple[SortField, bool], Callable[[Sequence[Mapping[str, Any]]], list]]:
+    """
+    Build one monomorphic sort closure per (sort field, reverse) pair.
+
+    Each closure binds its key function and direction flag as defaults at
+    import time, so dispatching a sort is a single dict lookup followed by
+    one `sorted` call with constant arguments - no string comparisons or
+    key-function resolution happen per call.
+    """
+    dispatch: dict[tuple[SortField, bool], Callable] = {}
+    for field_member, key_fn in key_funcs.items():
+        for reverse in (False, True):
+            dispatch[(field_member, reverse)] = (
+                lambda offers, _key=key_fn, _reverse=reverse: sorted(
+                    offers, key=_key, reverse=_reverse
+                )
+            )
+    return dispatch
+
+
+# Read-only views: the dispatch tables are fully populated at import and
+# never mutated afterwards, which a proxy enforces and which keeps the
+# underlying dicts' version tags stable for CPython's inline caches.
+_DISPATCH = types.MappingProxyType(_build_dispatch(_KEY_FUNCS))
+_PRECISE_DISPATCH = types.MappingProxyType(_build_dispatch(_PRECISE_KEY_FUNCS))
+
+
+__all__ = ["Offer", "OfferSorter", "SortedView"]
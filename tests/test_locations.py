@@ -6,6 +6,7 @@ from typing import AsyncGenerator
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.models import Location
@@ -29,7 +30,6 @@ async def test_get_location_details_success(
     )
     test_session_with_commit.add(location)
     await test_session_with_commit.commit()
-    await test_session_with_commit.refresh(location)
 
     # Act: call the endpoint
     response = await test_client.get(f"/locations/{location.location_id}")
@@ -114,10 +114,10 @@ async def test_list_locations_returns_all_fields(
     # Act: call the endpoint without parameters
     response = await test_client.get("/locations/")
 
-    # Assert: endpoint returns 200 and list of locations
+    # Assert: endpoint returns 200 and a page of locations
     assert response.status_code == 200
 
-    data = response.json()
+    data = response.json()["items"]
     assert isinstance(data, list)
     assert len(data) == len(locations)
 
@@ -165,9 +165,13 @@ async def test_list_locations_default_pagination_limit_100(
     # Assert: only 100 locations are returned
     assert response.status_code == 200
 
-    data = response.json()
-    assert isinstance(data, list)
-    assert len(data) == 100
+    page = response.json()
+    assert isinstance(page["items"], list)
+    assert len(page["items"]) == 100
+
+    # A full page exposes the last id as cursor for the next page
+    assert page["has_more"] is True
+    assert page["next_cursor"] == page["items"][-1]["location_id"]
 
 
 @pytest.mark.asyncio
@@ -191,8 +195,11 @@ async def test_list_locations_skip_and_limit(
     ]
     test_session_with_commit.add_all(locations)
     await test_session_with_commit.commit()
-    for i in range(4):
-        await test_session_with_commit.refresh(locations[i])
+
+    # Reload the first rows in a single round-trip instead of refreshing
+    # each instance separately.
+    stmt = select(Location).order_by(Location.location_id).limit(4)
+    rows = (await test_session_with_commit.execute(stmt)).scalars().all()
 
     # Act: skip first 2 and take next 2
     response = await test_client.get("/locations/?skip=2&limit=2")
@@ -200,13 +207,49 @@ async def test_list_locations_skip_and_limit(
     # Assert
     assert response.status_code == 200
 
-    data = response.json()
+    data = response.json()["items"]
     assert isinstance(data, list)
     assert len(data) == 2
 
     # Ensure pagination is consistent with insertion order (by primary key)
     returned_ids = [item["location_id"] for item in data]
     assert returned_ids == [
-        locations[2].location_id,
-        locations[3].location_id,
+        rows[2].location_id,
+        rows[3].location_id,
     ]
+
+
+@pytest.mark.asyncio
+async def test_list_locations_after_id_cursor(
+    test_client: AsyncClient,
+    test_session_with_commit: AsyncSession,
+) -> None:
+    """Endpoint GET /locations/ supports keyset pagination via after_id cursor."""
+    # Arrange: create a few locations with predictable order
+    locations = [
+        Location(
+            city=f"City {i}",
+            locality=f"Locality {i}",
+            city_district=f"District {i}",
+            street=f"Street {i}",
+            full_address=f"Street {i} 1",
+            latitude=50.0 + i * 0.01,
+            longitude=20.0 + i * 0.01,
+        )
+        for i in range(5)
+    ]
+    test_session_with_commit.add_all(locations)
+    await test_session_with_commit.commit()
+
+    # Act: fetch the first page and follow its cursor
+    first_page = (await test_client.get("/locations/?limit=2")).json()
+    second_page = (
+        await test_client.get(f"/locations/?limit=2&after_id={first_page['next_cursor']}")
+    ).json()
+
+    # Assert: pages do not overlap and follow primary key order
+    first_ids = [item["location_id"] for item in first_page["items"]]
+    second_ids = [item["location_id"] for item in second_page["items"]]
+    assert first_page["has_more"] is True
+    assert first_page["next_cursor"] == first_ids[-1]
+    assert second_ids == [first_ids[-1] + 1, first_ids[-1] + 2]
@@ -28,15 +28,11 @@ async def test_get_offers_sorted_by_price_desc(
     owner = Owner(owner_type="agency")
     features = Features(has_parking=True)
 
+    # Primary keys are populated by the INSERT itself on flush, so no
+    # per-instance refresh round-trips are needed after commit.
     test_session_with_commit.add_all([location, building, owner, features])
     await test_session_with_commit.commit()
 
-    # Reload to get primary keys
-    await test_session_with_commit.refresh(location)
-    await test_session_with_commit.refresh(building)
-    await test_session_with_commit.refresh(owner)
-    await test_session_with_commit.refresh(features)
-
     # Arrange: create listings with different total prices
     listings = [
         Listing(
@@ -84,4 +80,60 @@ async def test_get_offers_sorted_by_price_desc(
     prices = [Decimal(item["price_total_zl"]) for item in data]
     assert prices == sorted(prices, reverse=True)
 
+    # List view exposes only summary columns, not the large text fields
+    for item in data:
+        assert "description_text" not in item
+        assert "url" not in item
+
+
+@pytest.mark.asyncio
+async def test_get_offer_details_success(
+    test_client: AsyncClient,
+    test_session_with_commit: AsyncSession,
+) -> None:
+    """GET /offers/{listing_id} returns the full record of an existing offer."""
+    # Arrange: create related entities and one listing
+    location = Location(city="Warszawa")
+    building = Building(year_built=2000)
+    owner = Owner(owner_type="agency")
+    features = Features(has_parking=True)
+
+    test_session_with_commit.add_all([location, building, owner, features])
+    await test_session_with_commit.commit()
+
+    listing = Listing(
+        location_id=location.location_id,
+        building_id=building.building_id,
+        owner_id=owner.owner_id,
+        features_id=features.features_id,
+        area=Decimal("50.0"),
+        price_total_zl=Decimal("500000"),
+        description_text="Przestronne mieszkanie w centrum",
+        url="https://example.com/offer/1",
+    )
+    test_session_with_commit.add(listing)
+    await test_session_with_commit.commit()
+
+    # Act
+    response = await test_client.get(f"/offers/{listing.listing_id}")
+
+    # Assert: full record including the fields the list view omits
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["listing_id"] == listing.listing_id
+    assert data["description_text"] == listing.description_text
+    assert data["url"] == listing.url
+
+
+@pytest.mark.asyncio
+async def test_get_offer_details_not_found(
+    test_client: AsyncClient,
+) -> None:
+    """GET /offers/{listing_id} returns 404 when offer does not exist."""
+    response = await test_client.get("/offers/999999")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Offer not found"
+
 
@@ -15,45 +15,31 @@ from __future__ import annotations
 
 from datetime import date
 
-from offer_sorter import OfferSorter
+from offer_sorter import Offer, OfferSorter
 
 
-def create_offers() -> list[dict]:
+# Built once at module scope: the tests only read the offers, so sharing a
+# single list avoids rebuilding identical records per test and lets
+# OfferSorter's permutation cache key on the sequence identity.
+_BASE_OFFERS: list[Offer] = [
+    Offer(id=1, price=500_000, area=50, date_added=date(2024, 1, 10)),
+    Offer(id=2, price=450_000, area=50, date_added=date(2024, 1, 12)),
+    Offer(id=3, price=600_000, area=75, date_added=date(2024, 1, 8)),
+    Offer(id=4, price=400_000, area=32, date_added=date(2024, 1, 15)),
+]
+
+
+def create_offers() -> list[Offer]:
     """
-    Return a deterministic list of offer dicts for sorting tests.
+    Return a deterministic list of offer records for sorting tests.
 
-    The keys intentionally match domain concepts from the user story.
+    The fields intentionally match domain concepts from the user story.
+    `price_per_sqm` is deliberately not stored – it is a pure function of
+    `price` and `area`, and the record derives it on demand. `Offer` keeps
+    the mapping-style `offer["id"]` access the assertions below rely on.
+    The returned list is shared between tests and must not be mutated.
     """
-    return [
-        {
-            "id": 1,
-            "price": 500_000,
-            "price_per_sqm": 10_000,
-            "area": 50,
-            "date_added": date(2024, 1, 10),
-        },
-        {
-            "id": 2,
-            "price": 450_000,
-            "price_per_sqm": 9_000,
-            "area": 50,
-            "date_added": date(2024, 1, 12),
-        },
-        {
-            "id": 3,
-            "price": 600_000,
-            "price_per_sqm": 8_000,
-            "area": 75,
-            "date_added": date(2024, 1, 8),
-        },
-        {
-            "id": 4,
-            "price": 400_000,
-            "price_per_sqm": 12_500,
-            "area": 32,
-            "date_added": date(2024, 1, 15),
-        },
-    ]
+    return _BASE_OFFERS
 
 
 def test_sort_by_price_ascending() -> None:
@@ -149,6 +135,43 @@ def test_sort_by_area_descending() -> None:
     assert [offer["id"] for offer in sorted_offers] == [3, 1, 2, 4]
 
 
+def test_sorted_result_supports_indexing_and_slicing() -> None:
+    """Sorted results behave as sequences: len, indexing and slicing work."""
+    offers = create_offers()
+
+    sorted_offers = OfferSorter.sort_offers(
+        offers=offers,
+        sort_by="price",
+        direction="asc",
+    )
+
+    assert len(sorted_offers) == 4
+    assert sorted_offers[0]["id"] == 4
+    assert [offer["id"] for offer in sorted_offers[1:3]] == [2, 1]
+
+
+def test_sort_offers_many_matches_single_sorts() -> None:
+    """Batch sorting returns the same permutations as per-field calls."""
+    offers = create_offers()
+    specs = [
+        ("price", "asc"),
+        ("price", "desc"),
+        ("area", "desc"),
+        ("date_added", "desc"),
+    ]
+
+    results = OfferSorter.sort_offers_many(offers=offers, specs=specs)
+
+    assert set(results) == set(specs)
+    for field, direction in specs:
+        expected = OfferSorter.sort_offers(
+            offers=offers, sort_by=field, direction=direction
+        )
+        assert [offer["id"] for offer in results[(field, direction)]] == [
+            offer["id"] for offer in expected
+        ]
+
+
 def test_default_sort_returns_offers_unchanged() -> None:
     """
     Default sorting is set to "Najtrafniejsze".